@@ -1,37 +1,99 @@
 import sys
 import os
+import copy
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import tkinter as tk
-from tkinter import messagebox
-import json
+from tkinter import messagebox, ttk
 from pathlib import Path
 
+# Prefer the faster JSON backends when they are installed
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+
+def _dumps(obj):
+    """Serialize obj to JSON bytes - orjson returns bytes, ujson/json return str"""
+    data = _json.dumps(obj)
+    return data if isinstance(data, bytes) else data.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str, mtime_ns):
+    """Read and parse a config file; mtime_ns keys the cache so edits are re-read.
+    
+    Callers must copy the result before mutating it.
+    """
+    with open(path_str, 'rb') as f:
+        return _json.loads(f.read())
+
+
+def _read_config(path):
+    """Read and parse the config at path, reusing the cached parse if unchanged"""
+    return _load_config_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _write_config(path, data):
+    """Atomically write serialized config bytes to path via a temp file"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # The window may already be gone, so log instead of showing a dialog
+        print(f"Error saving config: {e}")
+
+
+@dataclass(slots=True, frozen=True)
+class Palette:
+    """Colors for one theme"""
+    bg: str
+    fg: str
+    button: str
+    button_hover: str
+    button_selected: str
+    entry_bg: str
+    entry_fg: str
+    checkbox_select: str
+    text_area_bg: str
+    text_area_fg: str
+
+
 class ShoutApp:
     # Default color schemes
     COLOR_SCHEMES = {
-        "dark": {
-            "bg": "#2E2E2E",
-            "fg": "#FFFFFF",
-            "button": "#444",
-            "button_hover": "#777",
-            "button_selected": "#00A8E8",
-            "entry_bg": "#444",
-            "entry_fg": "#FFFFFF",
-            "checkbox_select": "#777",
-            "text_area_bg": "#333",
-            "text_area_fg": "#FFFFFF"
-        },
-        "light": {
-            "bg": "#FFFFFF",
-            "fg": "#000000",
-            "button": "#DDDDDD",
-            "button_hover": "#AAAAAA",
-            "button_selected": "#0078D7",
-            "entry_bg": "#DDDDDD",
-            "entry_fg": "#000000",
-            "checkbox_select": "#AAAAAA",
-            "text_area_bg": "#F0F0F0",
-            "text_area_fg": "#000000"
-        }
+        "dark": Palette(
+            bg="#2E2E2E",
+            fg="#FFFFFF",
+            button="#444",
+            button_hover="#777",
+            button_selected="#00A8E8",
+            entry_bg="#444",
+            entry_fg="#FFFFFF",
+            checkbox_select="#777",
+            text_area_bg="#333",
+            text_area_fg="#FFFFFF"
+        ),
+        "light": Palette(
+            bg="#FFFFFF",
+            fg="#000000",
+            button="#DDDDDD",
+            button_hover="#AAAAAA",
+            button_selected="#0078D7",
+            entry_bg="#DDDDDD",
+            entry_fg="#000000",
+            checkbox_select="#AAAAAA",
+            text_area_bg="#F0F0F0",
+            text_area_fg="#000000"
+        )
     }
     
     # Predefined groups
@@ -49,7 +111,7 @@ class ShoutApp:
     # Config file path
     CONFIG_FILE = Path.home() / ".shout_config.json"
     
-    def __init__(self, root):
+    def __init__(self, root, config_future=None):
         self.root = root
         self.root.title("Shout!")
         
@@ -60,27 +122,43 @@ class ShoutApp:
         self.root.minsize(1000, 650)
         
         # Initialize variables
-        self.group_var = tk.StringVar()
+        self._current_group = ""  # Plain group name; the "@" is added when formatting
         self.always_on_top_var = tk.BooleanVar()
-        self.buttons = {}
-        self.labels = []
+        self.group_names = []  # Full group name for each group list row
+        self.group_index = {}  # Full group name -> group list row
         self.entries = []
-        self.all_frames = []  # Track all frames for theme application
+        self._theme_job = None  # Pending after_idle restyle, if any
+        self._to_reset = []  # Entries currently highlighted as empty
+        self._reset_job = None  # Pending after() that clears the highlight
+        
+        # Frames, labels and buttons are ttk widgets styled per class, so a theme
+        # switch is one style call per class rather than one configure per widget.
+        # The native Windows/macOS themes ignore background colors, clam honors them.
+        self.style = ttk.Style(self.root)
+        self.style.theme_use("clam")
         
         # Load config or use defaults
-        self.load_config()
+        self.load_config(config_future)
         
-        # Set up the UI
-        self.setup_ui()
+        # Cache the active palette so selection changes don't query Tk for the theme
+        self._active_colors = self.COLOR_SCHEMES[self.config["theme"]]
         
-        # Apply theme - this needs to happen after UI is completely set up
+        # Apply theme before the UI is built, so classic Tk widgets take their
+        # colors from the option database as they are created
         self.apply_theme()
         
+        # Set up the UI
+        self.setup_ui()
+        
         # Set up keyboard shortcuts
         self.setup_shortcuts()
         
-    def load_config(self):
-        """Load configuration from file or use defaults"""
+    def load_config(self, config_future=None):
+        """Load configuration from file or use defaults
+        
+        config_future, if given, is a pending _read_config of CONFIG_FILE started
+        before the window was created; its result is used instead of reading here.
+        """
         self.config = {
             "theme": "dark",
             "groups": self.DEFAULT_GROUPS.copy(),  # Create a copy to ensure we don't modify the original
@@ -93,69 +171,69 @@ class ShoutApp:
             if full_name not in self.config["groups"]:
                 self.config["groups"].append(full_name)
         
-        # Try to load from config file
-        if self.CONFIG_FILE.exists():
-            try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    loaded_config = json.load(f)
-                    
-                    # Make sure we're not losing the default groups when loading config
-                    if "groups" in loaded_config:
-                        # Ensure all default groups and special groups are present
-                        for group in self.DEFAULT_GROUPS:
-                            if group not in loaded_config["groups"]:
-                                loaded_config["groups"].append(group)
-                        
-                        for _, full_name in self.SPECIAL_GROUPS.items():
-                            if full_name not in loaded_config["groups"]:
-                                loaded_config["groups"].append(full_name)
-                    
-                    self.config.update(loaded_config)
-            except (json.JSONDecodeError, IOError) as e:
-                # Log the error but continue with defaults
-                print(f"Error loading config: {e}")
+        # Try to load from config file; a missing file just means defaults
+        try:
+            if config_future is not None:
+                loaded_config = copy.deepcopy(config_future.result())
+            else:
+                loaded_config = copy.deepcopy(_read_config(self.CONFIG_FILE))
+            
+            # Make sure we're not losing the default groups when loading config
+            if "groups" in loaded_config:
+                # Ensure all default groups and special groups are present, in order
+                existing = set(loaded_config["groups"])
+                for group in self.DEFAULT_GROUPS + list(self.SPECIAL_GROUPS.values()):
+                    if group not in existing:
+                        loaded_config["groups"].append(group)
+                        existing.add(group)
+            
+            self.config.update(loaded_config)
+        except FileNotFoundError:
+            pass
+        except (ValueError, IOError) as e:  # Each backend's decode error is a ValueError
+            # Log the error but continue with defaults
+            print(f"Error loading config: {e}")
         
         # Apply loaded config to variables
         self.always_on_top_var.set(self.config["always_on_top"])
         
     def save_config(self):
-        """Save current configuration to file"""
-        try:
-            # Update config with current values
-            self.config["theme"] = "light" if self.is_light_mode() else "dark"
-            self.config["always_on_top"] = self.always_on_top_var.get()
-            if self.group_var.get():
-                self.config["last_used_group"] = self.group_var.get().replace("@", "")
-            
-            # Save to file
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f)
-        except IOError as e:
-            messagebox.showwarning("Configuration Save Error", 
-                                  f"Could not save configuration: {e}")
+        """Save current configuration to file on a background thread
+        
+        The config is serialized here, on the UI thread, so only the disk write
+        happens in the background. Returns the (non-daemon) writer thread.
+        """
+        # Update config with current values
+        self.config["theme"] = "light" if self.is_light_mode() else "dark"
+        self.config["always_on_top"] = self.always_on_top_var.get()
+        if self._current_group:
+            self.config["last_used_group"] = self._current_group
+        
+        # Save to file without blocking the caller; the interpreter waits for
+        # non-daemon threads before exiting, so the write always completes
+        writer = threading.Thread(target=_write_config, args=(self.CONFIG_FILE, _dumps(self.config)))
+        writer.start()
+        return writer
     
     def setup_ui(self):
         """Create all UI elements"""
         # Create main frames
-        self.main_frame = tk.Frame(self.root)
+        self.main_frame = ttk.Frame(self.root, style="Shout.TFrame")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
-        self.all_frames.append(self.main_frame)
         
-        self.left_frame = tk.Frame(self.main_frame)
+        self.left_frame = ttk.Frame(self.main_frame, style="Shout.TFrame")
         self.left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
-        self.all_frames.append(self.left_frame)
         
         # Create a right frame that uses grid for better layout control
-        self.right_frame = tk.Frame(self.main_frame)
+        self.right_frame = ttk.Frame(self.main_frame, style="Shout.TFrame")
         self.right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self.all_frames.append(self.right_frame)
         
         # Configure the right frame's grid
         self.right_frame.grid_columnconfigure(0, weight=1)
         self.right_frame.grid_rowconfigure(2, weight=1)  # Make the output area expandable
         
-        # Create group selection buttons
-        self.create_group_buttons()
+        # Create group selection list
+        self.create_group_list()
         
         # Create input fields (row 0)
         self.create_input_fields()
@@ -169,37 +247,32 @@ class ShoutApp:
         # Create footer controls (row 3 - fixed at bottom)
         self.create_footer_controls()
     
-    def create_group_buttons(self):
-        """Create buttons for each group"""
+    def create_group_list(self):
+        """Create the group selection list"""
         # Group label
-        group_label = tk.Label(self.left_frame, text="Select Group:")
+        group_label = ttk.Label(self.left_frame, text="Select Group:", style="Shout.TLabel")
         group_label.pack(anchor="w", pady=(0, 5))
-        self.labels.append(group_label)
-        
-        # Create a simple frame for buttons instead of scrollable canvas
-        button_frame = tk.Frame(self.left_frame)
-        button_frame.pack(fill=tk.BOTH, expand=True)
-        self.all_frames.append(button_frame)
-        
-        # Regular groups from the DEFAULT_GROUPS constant
-        for group in self.DEFAULT_GROUPS:
-            btn = tk.Button(button_frame, text=group, 
-                           command=lambda g=group: self.set_group(g),
-                           width=25, relief=tk.FLAT)
-            btn.pack(pady=2, padx=1, fill=tk.X)
-            self.buttons[group] = btn
-        
-        # Special groups with different display names
-        for display_name, full_name in self.SPECIAL_GROUPS.items():
-            btn = tk.Button(button_frame, text=display_name,
-                           command=lambda g=full_name: self.set_group(g),
-                           width=25, relief=tk.FLAT)
-            btn.pack(pady=2, padx=1, fill=tk.X)
-            self.buttons[full_name] = btn
+        
+        # A single Listbox renders only its visible rows, so the startup cost
+        # doesn't grow with the number of groups the way one button per group did
+        self.group_listbox = tk.Listbox(self.left_frame, height=20, width=25,
+                                        exportselection=False, activestyle="none",
+                                        relief=tk.FLAT, borderwidth=0, highlightthickness=0)
+        self.group_listbox.pack(fill=tk.BOTH, expand=True)
+        self.group_listbox.bind("<<ListboxSelect>>", self._on_group_select)
+        
+        # Regular groups from the DEFAULT_GROUPS constant, then special groups
+        # with different display names
+        groups = [(group, group) for group in self.DEFAULT_GROUPS]
+        groups += list(self.SPECIAL_GROUPS.items())
+        for display_name, group in groups:
+            self.group_index[group] = len(self.group_names)
+            self.group_names.append(group)
+        self.group_listbox.insert(tk.END, *(display_name for display_name, _ in groups))
             
         # Set last used group if available
         if self.config["last_used_group"]:
-            if self.config["last_used_group"] in self.buttons:
+            if self.config["last_used_group"] in self.group_index:
                 self.set_group(self.config["last_used_group"])
     
     def create_input_fields(self):
@@ -212,18 +285,15 @@ class ShoutApp:
         ]
         
         # Create a container frame for all input fields
-        input_container = tk.Frame(self.right_frame)
+        input_container = ttk.Frame(self.right_frame, style="Shout.TFrame")
         input_container.grid(row=0, column=0, sticky="ew", pady=5)
-        self.all_frames.append(input_container)
         
         for i, (label_text, attr_name) in enumerate(fields):
-            frame = tk.Frame(input_container)
+            frame = ttk.Frame(input_container, style="Shout.TFrame")
             frame.pack(fill=tk.X, pady=2)
-            self.all_frames.append(frame)
             
-            label = tk.Label(frame, text=label_text, width=20, anchor="w")
+            label = ttk.Label(frame, text=label_text, width=20, anchor="w", style="Shout.TLabel")
             label.pack(side=tk.LEFT)
-            self.labels.append(label)
             
             entry = tk.Entry(frame, width=50)
             entry.pack(side=tk.RIGHT, fill=tk.X, expand=True)
@@ -235,44 +305,52 @@ class ShoutApp:
     def create_action_buttons(self):
         """Create buttons for generating message and copying"""
         # Create frame with explicit background color to fix white bar
-        self.button_frame = tk.Frame(self.right_frame)
+        self.button_frame = ttk.Frame(self.right_frame, style="Shout.TFrame")
         self.button_frame.grid(row=1, column=0, sticky="ew", pady=5)
-        self.all_frames.append(self.button_frame)
         
-        self.generate_button = tk.Button(self.button_frame, text="Generate Message", 
-                                        command=self.generate_message, 
-                                        relief=tk.FLAT)
+        self.generate_button = ttk.Button(self.button_frame, text="Generate Message", 
+                                         command=self.generate_message, 
+                                         style="Shout.TButton")
         self.generate_button.pack(side=tk.LEFT, padx=5)
         
-        self.copy_button = tk.Button(self.button_frame, text="Copy to Clipboard", 
-                                    command=self.copy_to_clipboard, 
-                                    relief=tk.FLAT)
+        self.copy_button = ttk.Button(self.button_frame, text="Copy to Clipboard", 
+                                     command=self.copy_to_clipboard, 
+                                     style="Shout.TButton")
         self.copy_button.pack(side=tk.LEFT, padx=5)
         
-        self.clear_button = tk.Button(self.button_frame, text="Clear Fields", 
-                                     command=self.clear_fields, 
-                                     relief=tk.FLAT)
+        self.clear_button = ttk.Button(self.button_frame, text="Clear Fields", 
+                                      command=self.clear_fields, 
+                                      style="Shout.TButton")
         self.clear_button.pack(side=tk.LEFT, padx=5)
     
     def create_output_area(self):
         """Create output text area"""
-        self.output_frame = tk.Frame(self.right_frame)
+        self.output_frame = ttk.Frame(self.right_frame, style="Shout.TFrame")
         self.output_frame.grid(row=2, column=0, sticky="nsew", pady=5)
-        self.all_frames.append(self.output_frame)
         
-        self.output_label = tk.Label(self.output_frame, text="Generated Message:")
+        self.output_label = ttk.Label(self.output_frame, text="Generated Message:", style="Shout.TLabel")
         self.output_label.pack(anchor="w")
-        self.labels.append(self.output_label)
         
-        self.output_text = tk.Text(self.output_frame, height=5, width=70)
+        # Output is replaced wholesale on every generate, so there is nothing to undo
+        self.output_text = tk.Text(self.output_frame, height=5, width=70,
+                                   undo=False, autoseparators=False)
         self.output_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Replace, select and focus the output in one Tcl call. The message is
+        # passed as an argument rather than spliced into a script, so braces or
+        # brackets in a URL can't break (or inject into) the command.
+        self.root.tk.eval(
+            "proc shout_show_message {w text} {"
+            " $w delete 1.0 end; $w insert end $text;"
+            " $w tag add sel 1.0 end; $w mark set insert 1.0;"
+            " $w see insert; focus $w }"
+        )
     
     def create_footer_controls(self):
         """Create footer controls like theme toggle and always on top"""
         # Create a dedicated frame for the footer with explicit styling that stays at the bottom
-        self.footer_frame = tk.Frame(self.right_frame)
+        self.footer_frame = ttk.Frame(self.right_frame, style="Shout.TFrame")
         self.footer_frame.grid(row=3, column=0, sticky="ew", pady=5)
-        self.all_frames.append(self.footer_frame)
         
         # Always on top checkbox - explicitly styled
         self.always_on_top_checkbox = tk.Checkbutton(
@@ -285,21 +363,21 @@ class ShoutApp:
         
         # Create a fixed-width label for shortcuts with explicit styling
         # This replaces the previous status label implementation
-        self.shortcuts_label = tk.Label(
+        self.shortcuts_label = ttk.Label(
             self.footer_frame,
             text="Shortcuts: Ctrl+G (Generate), Ctrl+C (Copy), Ctrl+L (Clear), F1 (Help)",
             anchor="w",
-            padx=5
+            padding=(5, 0),
+            style="Shout.TLabel"
         )
         self.shortcuts_label.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
-        self.labels.append(self.shortcuts_label)
         
         # Theme toggle button - explicit styling
-        self.theme_button = tk.Button(
+        self.theme_button = ttk.Button(
             self.footer_frame, 
             text="Switch to Light Mode" if self.config["theme"] == "dark" else "Switch to Dark Mode",
             command=self.toggle_theme, 
-            relief=tk.FLAT
+            style="Shout.TButton"
         )
         self.theme_button.pack(side=tk.RIGHT, padx=5)
     
@@ -327,31 +405,28 @@ Usage:
         """
         messagebox.showinfo("Shout Help", help_text)
     
+    def _on_group_select(self, event):
+        """Record the group picked in the group list"""
+        selection = self.group_listbox.curselection()
+        if selection:
+            self._current_group = self.group_names[selection[0]]
+    
     def set_group(self, group_name):
         """Set the selected group and update UI"""
-        # Clear any previous selection
-        for group, btn in self.buttons.items():
-            btn.config(bg=self.get_current_colors()["button"],
-                      fg=self.get_current_colors()["fg"])
-        
-        # Set the new group and highlight its button
-        self.group_var.set(f"@{group_name}")
-        self.buttons[group_name].config(
-            bg=self.get_current_colors()["button_selected"],
-            fg=self.get_current_colors()["fg"]
-        )
+        index = self.group_index[group_name]
+        self.group_listbox.selection_clear(0, tk.END)
+        self.group_listbox.selection_set(index)
+        self.group_listbox.see(index)
+        self._current_group = group_name
     
     def generate_message(self):
         """Generate and display the formatted message"""
-        # Get values from fields
-        group = self.group_var.get()
-        inc_number = self.inc_entry.get().strip()
-        description = self.desc_entry.get().strip()
-        problem_ticket = self.problem_entry.get().strip()
-        url = self.url_entry.get().strip()
+        # Get values from fields, reading and stripping each entry once
+        vals = [entry.get().strip() for entry in
+                (self.inc_entry, self.desc_entry, self.problem_entry, self.url_entry)]
         
         # Validate inputs
-        if not group or not inc_number or not description or not problem_ticket or not url:
+        if not self._current_group or not all(vals):
             messagebox.showwarning("Missing Information", 
                                   "Please fill out all fields before generating the message.")
             
@@ -360,15 +435,10 @@ Usage:
             return
         
         # Format and display message
-        output = f"{group} {inc_number} Problem {problem_ticket} {description}\n\n{url}"
-        self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, output)
-        
-        # Auto-select the text for easy copying
-        self.output_text.tag_add(tk.SEL, "1.0", tk.END)
-        self.output_text.mark_set(tk.INSERT, "1.0")
-        self.output_text.see(tk.INSERT)
-        self.output_text.focus_set()
+        inc_number, description, problem_ticket, url = vals
+        output = f"@{self._current_group} {inc_number} Problem {problem_ticket} {description}\n\n{url}"
+        # Display it, auto-selecting the text for easy copying
+        self.root.tk.call("shout_show_message", str(self.output_text), output)
     
     def highlight_empty_fields(self):
         """Highlight empty fields with a red background temporarily"""
@@ -379,13 +449,28 @@ Usage:
             (self.url_entry, "url")
         ]
         
+        # Restore any fields still highlighted from a previous attempt first
+        if self._reset_job is not None:
+            self.root.after_cancel(self._reset_job)
+            self._reset_highlighted()
+        
         for entry, field_name in fields:
             if not entry.get().strip():
-                original_bg = entry.cget("bg")
                 entry.config(bg="#FF9999")  # Light red background
-                
-                # Reset after 1.5 seconds
-                self.root.after(1500, lambda e=entry, bg=original_bg: e.config(bg=bg))
+                self._to_reset.append(entry)
+        
+        # Reset all highlighted fields together after 1.5 seconds
+        if self._to_reset:
+            self._reset_job = self.root.after(1500, self._reset_highlighted)
+    
+    def _reset_highlighted(self):
+        """Restore the background of fields flagged by highlight_empty_fields"""
+        self._reset_job = None
+        # Entries always use the palette background, so there's nothing to query
+        entry_bg = self._active_colors.entry_bg
+        for entry in self._to_reset:
+            entry.config(bg=entry_bg)
+        self._to_reset.clear()
     
     def copy_to_clipboard(self):
         """Copy the generated message to clipboard"""
@@ -396,9 +481,9 @@ Usage:
             return
         
         try:
-            self.root.clipboard_clear()
-            self.root.clipboard_append(output_text)
-            self.root.update()
+            # Tk updates the clipboard synchronously, so no update() flush is needed
+            self.root.tk.call("clipboard", "clear")
+            self.root.tk.call("clipboard", "append", "--", output_text)
             
             # Show temporary success message in the shortcuts label
             original_text = self.shortcuts_label.cget("text")
@@ -431,79 +516,114 @@ Usage:
             self.theme_button.config(text="Switch to Dark Mode")
             self.config["theme"] = "light"
         
+        self._active_colors = self.COLOR_SCHEMES[self.config["theme"]]
+        
+        # Restyle once the event queue is idle; repeated toggles share one pass
+        if self._theme_job is None:
+            self._theme_job = self.root.after_idle(self._apply_theme_batch)
+    
+    def _apply_theme_batch(self):
+        """Apply the theme and let Tk do a single layout and repaint pass"""
+        self._theme_job = None
         self.apply_theme()
+        self.restyle_tk_widgets()
+        self.root.tk.call("update", "idletasks")
     
     def is_light_mode(self):
         """Check if the app is currently in light mode"""
-        return self.root.cget("bg") == self.COLOR_SCHEMES["light"]["bg"]
+        return self.config["theme"] == "light"
     
     def get_current_colors(self):
-        """Get the current color scheme based on theme"""
-        theme = "light" if self.is_light_mode() else "dark"
-        return self.COLOR_SCHEMES[theme]
+        """Get the current color scheme, cached whenever the theme changes"""
+        return self._active_colors
     
     def apply_theme(self):
-        """Apply the current theme to all widgets"""
-        colors = self.COLOR_SCHEMES[self.config["theme"]]
-        
-        # First apply to root
-        self.root.configure(bg=colors["bg"])
+        """Apply the current theme to the root, the ttk styles and the option database
         
-        # Apply to ALL frames (crucial for fixing the white bar)
-        for frame in self.all_frames:
-            frame.configure(bg=colors["bg"])
-        
-        # Update all labels
-        for label in self.labels:
-            label.configure(bg=colors["bg"], fg=colors["fg"])
-        
-        # Update group buttons
-        for group, btn in self.buttons.items():
-            if self.group_var.get() == f"@{group}":
-                btn.configure(bg=colors["button_selected"], fg=colors["fg"])
-            else:
-                btn.configure(bg=colors["button"], fg=colors["fg"], 
-                             activebackground=colors["button_hover"])
+        Classic Tk widgets that already exist are restyled by restyle_tk_widgets.
+        """
+        self._active_colors = self.COLOR_SCHEMES[self.config["theme"]]
+        colors = self._active_colors
         
-        # Update action buttons
-        for btn in [self.generate_button, self.copy_button, self.clear_button, self.theme_button]:
-            btn.configure(bg=colors["button"], fg=colors["fg"], 
-                         activebackground=colors["button_hover"])
+        # First apply to root
+        self.root.configure(bg=colors.bg)
+        
+        # Frames, labels and buttons pick up their colors from the shared styles
+        self.style.configure("Shout.TFrame", background=colors.bg)
+        self.style.configure("Shout.TLabel", background=colors.bg, foreground=colors.fg)
+        
+        # Flatten clam's bevel by drawing the border in the button color
+        self.style.configure("Shout.TButton", background=colors.button, foreground=colors.fg,
+                             bordercolor=colors.button, lightcolor=colors.button,
+                             darkcolor=colors.button, relief=tk.FLAT)
+        self.style.map("Shout.TButton", background=[("active", colors.button_hover)])
+        
+        # Entries, text area, checkbox and group list remain classic Tk widgets -
+        # entries flash their own background on validation, which ttk can only do
+        # via extra styles. Their colors come from the option database per class;
+        # Tk reads it only when a widget is created.
+        for pattern, value in [
+            ("*Listbox.background", colors.button),
+            ("*Listbox.foreground", colors.fg),
+            ("*Listbox.selectBackground", colors.button_selected),
+            ("*Listbox.selectForeground", colors.fg),
+            ("*Entry.background", colors.entry_bg),
+            ("*Entry.foreground", colors.entry_fg),
+            ("*Text.background", colors.text_area_bg),
+            ("*Text.foreground", colors.text_area_fg),
+            ("*Text.insertBackground", colors.fg),
+            ("*Checkbutton.background", colors.bg),
+            ("*Checkbutton.foreground", colors.fg),
+            ("*Checkbutton.selectColor", colors.checkbox_select),
+            ("*Checkbutton.activeBackground", colors.bg),
+            ("*Checkbutton.highlightBackground", colors.bg),
+        ]:
+            self.root.option_add(pattern, value)
+    
+    def restyle_tk_widgets(self):
+        """Apply the current theme to classic Tk widgets created under an earlier theme"""
+        colors = self._active_colors
+        
+        # The group list highlights the selected group itself
+        self.group_listbox.configure(
+            bg=colors.button,
+            fg=colors.fg,
+            selectbackground=colors.button_selected,
+            selectforeground=colors.fg
+        )
         
         # Update entry fields
         for entry in self.entries:
-            entry.configure(bg=colors["entry_bg"], fg=colors["entry_fg"])
+            entry.configure(bg=colors.entry_bg, fg=colors.entry_fg)
         
         # Update text area
         self.output_text.configure(
-            bg=colors["text_area_bg"], 
-            fg=colors["text_area_fg"],
-            insertbackground=colors["fg"]
+            bg=colors.text_area_bg, 
+            fg=colors.text_area_fg,
+            insertbackground=colors.fg
         )
         
         # Update checkbox - specifically fix its background
         self.always_on_top_checkbox.configure(
-            bg=colors["bg"], 
-            fg=colors["fg"],
-            selectcolor=colors["checkbox_select"],
-            activebackground=colors["bg"],
-            highlightbackground=colors["bg"]
-        )
-        
-        # Ensure the shortcuts label has the correct styling
-        self.shortcuts_label.configure(
-            bg=colors["bg"],
-            fg=colors["fg"]
+            bg=colors.bg, 
+            fg=colors.fg,
+            selectcolor=colors.checkbox_select,
+            activebackground=colors.bg,
+            highlightbackground=colors.bg
         )
     
     def on_closing(self):
         """Handle application closing"""
+        # The config write finishes in the background while the window closes
         self.save_config()
         self.root.destroy()
 
 def main():
-    root = tk.Tk()
-    app = ShoutApp(root)
+    # Read the config file while Tk initializes - parsing it doesn't touch Tk
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        config_future = executor.submit(_read_config, ShoutApp.CONFIG_FILE)
+        root = tk.Tk()
+        app = ShoutApp(root, config_future)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
     root.mainloop()
 